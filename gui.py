@@ -3,29 +3,45 @@ from tkinter import messagebox, filedialog, ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import serial
+import os
+import sys
 import threading
+import multiprocessing as mp
+import queue
 import time
+import math
 import numpy as np
-import csv
 from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Control messages understood by the plot process (data points are tuples)
+PLOT_CLEAR = "CLEAR"
+PLOT_STOP = "STOP"
+
+# Feedback line prefixes sent by the Arduino
+ANGLE_PREFIX = b"Angle:"
+TARGET_REACHED_PREFIX = b"TARGET_REACHED"
+
 @dataclass
 class ServoConfig:
     """Configuration parameters for the servo system"""
     SERIAL_PORT: str = 'COM9'
     BAUDRATE: int = 9600
-    TIMEOUT: float = 1.0
+    TIMEOUT: Optional[float] = None  # Block reads until data arrives; shutdown uses cancel_read
     WRITE_TIMEOUT: float = 2.0
     MAX_DATA_POINTS: int = 1000
     UPDATE_INTERVAL_MS: int = 100
     PLOT_UPDATE_INTERVAL_MS: int = 50
+    ANGLE_DEBOUNCE_MS: int = 30
+    LOW_LATENCY: bool = True
+    # Lowers the USB-serial latency timer in sysfs; system-wide and persists after exit
+    SET_USB_LATENCY_TIMER: bool = False
 
 class SerialManager:
     """Manages serial communication with error handling and reconnection"""
@@ -34,6 +50,7 @@ class SerialManager:
         self.config = config
         self.ser: Optional[serial.Serial] = None
         self.is_connected = False
+        self._rx_buf = bytearray()
         self._connect()
     
     def _connect(self) -> bool:
@@ -47,12 +64,43 @@ class SerialManager:
             )
             self.is_connected = True
             logger.info(f"Connected to {self.config.SERIAL_PORT}")
+            if self.config.LOW_LATENCY:
+                self._enable_low_latency()
             return True
         except Exception as e:
             self.is_connected = False
             logger.warning(f"Serial connection failed: {e}")
             return False
     
+    def _enable_low_latency(self):
+        """Ask the driver to deliver short messages immediately (best effort)"""
+        try:
+            if sys.platform.startswith('linux'):
+                # ASYNC_LOW_LATENCY: deliver on the first byte instead of the 16 ms latency timer
+                self.ser.set_low_latency_mode(True)
+                if self.config.SET_USB_LATENCY_TIMER:
+                    self._set_usb_latency_timer(1)
+                logger.info("Low-latency serial mode enabled")
+            elif os.name == 'nt':
+                # No user-mode latency switch here (the FTDI latency timer is a driver setting)
+                self.ser.set_buffer_size(rx_size=4096, tx_size=4096)
+                logger.info("Serial driver buffers enlarged")
+        except Exception as e:
+            logger.warning(f"Could not enable low-latency serial mode: {e}")
+    
+    def _set_usb_latency_timer(self, latency_ms: int):
+        """Lower the USB-serial (FTDI) latency timer via sysfs, needs write permission"""
+        device = os.path.basename(os.path.realpath(self.config.SERIAL_PORT))
+        path = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+        if not os.path.exists(path):
+            return
+        
+        try:
+            with open(path, 'w') as f:
+                f.write(str(latency_ms))
+        except OSError as e:
+            logger.debug(f"Could not set {path}: {e}")
+    
     def write(self, data: str) -> bool:
         """Write data to serial port with error handling"""
         if not self.is_connected or not self.ser:
@@ -66,18 +114,32 @@ class SerialManager:
             self.is_connected = False
             return False
     
-    def readline(self) -> Optional[str]:
-        """Read line from serial port with error handling"""
+    def read_lines(self) -> List[bytes]:
+        """Read all complete raw lines available on the serial port with error handling"""
         if not self.is_connected or not self.ser:
-            return None
+            return []
         
         try:
-            line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-            return line if line else None
+            # Drain everything buffered in one call; when nothing is waiting,
+            # block in the driver until a byte arrives (or cancel_read)
+            self._rx_buf += self.ser.read(max(1, self.ser.in_waiting))
         except Exception as e:
             logger.error(f"Serial read failed: {e}")
             self.is_connected = False
-            return None
+            return []
+        
+        # Keep the trailing partial line for the next call
+        *raw_lines, self._rx_buf = self._rx_buf.split(b'\n')
+        lines = (bytes(raw).strip() for raw in raw_lines)
+        return [line for line in lines if line]
+    
+    def cancel_read(self):
+        """Wake up a read blocked in another thread"""
+        if self.ser and self.is_connected:
+            try:
+                self.ser.cancel_read()
+            except Exception as e:
+                logger.warning(f"Serial cancel_read failed: {e}")
     
     def close(self):
         """Close serial connection"""
@@ -86,78 +148,165 @@ class SerialManager:
             self.is_connected = False
 
 class DataManager:
-    """Manages servo data with efficient storage and statistics"""
+    """Manages servo data in preallocated ring buffers with running statistics"""
     
     def __init__(self, max_size: int = 1000):
         self.max_size = max_size
-        self.angle_data = deque(maxlen=max_size)
-        self.feedback_data = deque(maxlen=max_size)
-        self.error_data = deque(maxlen=max_size)
-        self.timestamps = deque(maxlen=max_size)
-        self._stats_cache = {}
-        self._stats_dirty = True
+        # Commanded, feedback and error share one block so snapshots are a single copy
+        self._series = np.empty((3, max_size), dtype=np.float32)
+        self.angles, self.feedback, self.error = self._series
+        self.timestamps = np.empty(max_size, dtype=np.float64)  # perf_counter() seconds
+        # Wall-clock anchor so exports can convert perf_counter() timestamps back
+        self._t0 = time.time()
+        self._perf0 = time.perf_counter()
+        self._head = 0
+        self._count = 0
+        self._version = 0  # Bumped on every change so consumers can skip redundant work
+        # The reader thread adds points while the Tk thread clears, exports and reads stats
+        self._lock = threading.Lock()
+        self._reset_statistics()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _reset_statistics(self):
+        """Reset running error statistics over the current window"""
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._abs_max = 0.0
+    
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        """Return a copy of buffer contents (along the last axis) oldest-first; call with the lock held"""
+        if self._count < self.max_size or self._head == 0:
+            return buf[..., :self._count].copy()
+        return np.concatenate((buf[..., self._head:], buf[..., :self._head]), axis=-1)
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (commanded, feedback, error) oldest-first from one consistent read"""
+        with self._lock:
+            commanded, feedback, error = self._ordered(self._series)
+        return commanded, feedback, error
     
     def add_data_point(self, commanded: float, feedback: float, timestamp: float = None):
-        """Add new data point and invalidate stats cache"""
+        """Add new data point (timestamp on the time.perf_counter() clock) and update running statistics"""
         if timestamp is None:
-            timestamp = time.time()
-        
-        error = commanded - feedback
+            timestamp = time.perf_counter()
         
-        self.angle_data.append(commanded)
-        self.feedback_data.append(feedback)
-        self.error_data.append(error)
-        self.timestamps.append(timestamp)
-        self._stats_dirty = True
+        with self._lock:
+            head = self._head
+            
+            # Remove the value about to be overwritten from the running sums
+            rescan_max = False
+            if self._count == self.max_size:
+                evicted = float(self.error[head])
+                self._sum -= evicted
+                self._sumsq -= evicted * evicted
+                rescan_max = abs(evicted) >= self._abs_max
+            else:
+                self._count += 1
+            
+            self.angles[head] = commanded
+            self.feedback[head] = feedback
+            self.error[head] = commanded - feedback
+            self.timestamps[head] = timestamp
+            self._head = (head + 1) % self.max_size
+            self._version += 1
+            
+            # Use the stored float32 value so eviction subtracts exactly what was added
+            error = float(self.error[head])
+            self._sum += error
+            self._sumsq += error * error
+            if rescan_max:
+                # Old maximum left the window, only now is a full scan needed
+                self._abs_max = float(np.abs(self.error).max())
+            elif abs(error) > self._abs_max:
+                self._abs_max = abs(error)
     
     def get_statistics(self) -> dict:
-        """Get cached statistics, recalculate if dirty"""
-        if self._stats_dirty and self.error_data:
-            errors = np.array(self.error_data)
-            self._stats_cache = {
-                'avg_error': np.mean(errors),
-                'max_error': np.max(np.abs(errors)),
-                'std_error': np.std(errors),
-                'count': len(errors)
-            }
-            self._stats_dirty = False
-        
-        return self._stats_cache
+        """Get error statistics from the running sums"""
+        with self._lock:
+            count, total, sumsq, abs_max = self._count, self._sum, self._sumsq, self._abs_max
+        if not count:
+            return {}
+        
+        mean = total / count
+        variance = max(sumsq / count - mean * mean, 0.0)
+        return {
+            'avg_error': mean,
+            'max_error': abs_max,
+            'std_error': math.sqrt(variance),
+            'count': count
+        }
     
     def clear(self):
         """Clear all data"""
-        self.angle_data.clear()
-        self.feedback_data.clear()
-        self.error_data.clear()
-        self.timestamps.clear()
-        self._stats_cache.clear()
-        self._stats_dirty = True
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self._version += 1
+            self._reset_statistics()
     
     def export_csv(self, filename: str) -> bool:
-        """Export data to CSV file"""
+        """Export data to CSV file, with timestamps converted to wall-clock epoch seconds"""
         try:
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Sample", "Timestamp", "Commanded_Angle", "Feedback_Angle", "Error"])
-                for i, (ts, cmd, fb, err) in enumerate(zip(
-                    self.timestamps, self.angle_data, self.feedback_data, self.error_data
-                )):
-                    writer.writerow([i+1, ts, cmd, fb, err])
+            # One locked read so every row's columns come from the same sample
+            with self._lock:
+                timestamps = self._ordered(self.timestamps)
+                commanded, feedback, error = self._ordered(self._series)
+            rows = np.column_stack((
+                np.arange(1, len(timestamps) + 1),
+                self._t0 + (timestamps - self._perf0), commanded, feedback, error
+            ))
+            np.savetxt(
+                filename, rows,
+                fmt=['%d', '%.6f', '%.3f', '%.3f', '%.3f'],
+                delimiter=',',
+                header="Sample,Timestamp,Commanded_Angle,Feedback_Angle,Error",
+                comments=''
+            )
             return True
         except Exception as e:
             logger.error(f"CSV export failed: {e}")
             return False
 
 class PlotManager:
-    """Manages matplotlib plots with optimized updates"""
+    """Manages matplotlib plots with blitted updates"""
     
-    def __init__(self, master):
+    def __init__(self, master, max_size: int = 1000):
+        self.max_size = max_size
+        self._x = np.arange(max_size)
+        # NaN-padded y buffers: the x axis never changes, unfilled samples aren't drawn
+        self._y_cmd = np.full(max_size, np.nan, dtype=np.float32)
+        self._y_fb = np.full(max_size, np.nan, dtype=np.float32)
+        self._y_err = np.full(max_size, np.nan, dtype=np.float32)
+        # Per-line x index buffers for downsampled frames, so LTTB doesn't allocate x each frame
+        self._i_cmd = np.empty(max_size, dtype=np.intp)
+        self._i_fb = np.empty(max_size, dtype=np.intp)
+        self._i_err = np.empty(max_size, dtype=np.intp)
+        # Lines currently showing downsampled (x, y) data instead of the full x axis
+        self._downsampled = set()
+        # LTTB bucket layout, reused while input and output sizes are unchanged
+        self._lttb_key = None
+        self._lttb_cache = None
+        # DataManager version last drawn, to skip frames with no new samples
+        self._last_version = -1
         self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(8, 6))
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=1)
         
+        # Cached axes backgrounds for blitting, refreshed on every full draw
+        self.bg1 = None
+        self.bg2 = None
+        
         self._setup_plots()
         self._plot_dirty = False
+        
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw()
     
     def _setup_plots(self):
         """Initialize plot settings"""
@@ -165,8 +314,10 @@ class PlotManager:
         self.ax1.set_title("Commanded vs Feedback Angle", fontsize=12)
         self.ax1.set_xlabel("Sample")
         self.ax1.set_ylabel("Angle (°)")
-        self.line_cmd, = self.ax1.plot([], [], 'b-', label='Commanded', linewidth=1)
-        self.line_fb, = self.ax1.plot([], [], 'r-', label='Feedback', linewidth=1)
+        self.line_cmd, = self.ax1.plot(self._x, self._y_cmd, 'b-', label='Commanded', linewidth=1, animated=True)
+        self.line_fb, = self.ax1.plot(self._x, self._y_fb, 'r-', label='Feedback', linewidth=1, animated=True)
+        self.ax1.set_xlim(0, self.max_size)
+        self.ax1.set_ylim(0, 180)
         self.ax1.legend()
         self.ax1.grid(True, alpha=0.3)
         
@@ -174,45 +325,259 @@ class PlotManager:
         self.ax2.set_title("Error (Commanded - Feedback)", fontsize=12)
         self.ax2.set_xlabel("Sample")
         self.ax2.set_ylabel("Error (°)")
-        self.line_err, = self.ax2.plot([], [], 'r-', label='Error', linewidth=1)
+        self.line_err, = self.ax2.plot(self._x, self._y_err, 'r-', label='Error', linewidth=1, animated=True)
+        self.ax2.set_xlim(0, self.max_size)
+        self.ax2.set_ylim(-180, 180)
         self.ax2.legend()
         self.ax2.grid(True, alpha=0.3)
         
         plt.tight_layout()
     
+    def _on_draw(self, event):
+        """Re-cache axes backgrounds after a full redraw (first show, resize)"""
+        self.bg1 = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self.bg2 = self.canvas.copy_from_bbox(self.ax2.bbox)
+        self._draw_lines()
+    
+    def _draw_lines(self):
+        """Draw the animated line artists onto the canvas renderer"""
+        self.ax1.draw_artist(self.line_cmd)
+        self.ax1.draw_artist(self.line_fb)
+        self.ax2.draw_artist(self.line_err)
+    
+    def _blit(self):
+        """Restore cached backgrounds and redraw only the line traces"""
+        if self.bg1 is None or self.bg2 is None:
+            return
+        
+        self.canvas.restore_region(self.bg1)
+        self.canvas.restore_region(self.bg2)
+        self._draw_lines()
+        self.canvas.blit(self.ax1.bbox)
+        self.canvas.blit(self.ax2.bbox)
+    
+    @staticmethod
+    def _fill(buf: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Copy values into the front of buf and NaN the rest"""
+        n = len(values)
+        buf[:n] = values
+        buf[n:] = np.nan
+        return buf
+    
+    def downsample_lttb(self, y: np.ndarray, n_out: int,
+                        idx_out: np.ndarray = None, y_out: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Downsample y to n_out points with a vectorized Largest-Triangle-Three-Buckets pass
+        
+        Each interior bucket keeps the point forming the largest triangle with the
+        means of its neighbouring buckets; the first and last points are always kept.
+        Results are written into the front of idx_out/y_out when given.
+        """
+        n_in = len(y)
+        if self._lttb_key != (n_in, n_out):
+            starts = np.linspace(1, n_in - 1, n_out - 1).astype(np.intp)[:-1]
+            counts = np.diff(np.append(starts, n_in - 1))
+            bucket = np.repeat(np.arange(n_out - 2), counts)
+            px = self._x[1:n_in - 1]
+            x_mean = np.add.reduceat(px, starts - 1) / counts
+            ax = np.concatenate(([0.0], x_mean[:-1]))[bucket]
+            cx = np.concatenate((x_mean[1:], [n_in - 1.0]))[bucket]
+            self._lttb_key = (n_in, n_out)
+            self._lttb_cache = (starts, counts, bucket, ax - cx, ax - px)
+        starts, counts, bucket, dx_ac, dx_ap = self._lttb_cache
+        
+        interior = y[1:n_in - 1].astype(np.float64)
+        y_mean = np.add.reduceat(interior, starts - 1) / counts
+        ay = np.concatenate(([y[0]], y_mean[:-1]))[bucket]
+        cy = np.concatenate((y_mean[1:], [y[-1]]))[bucket]
+        area = np.abs(dx_ac * (interior - ay) - dx_ap * (cy - ay))
+        
+        # Buckets are already contiguous, so sort within each by descending area
+        order = np.lexsort((-area, bucket))
+        idx = np.empty(n_out, dtype=np.intp) if idx_out is None else idx_out[:n_out]
+        idx[0] = 0
+        np.add(order[starts - 1], 1, out=idx[1:-1])
+        idx[-1] = n_in - 1
+        if y_out is None:
+            return idx, y[idx]
+        return idx, np.take(y, idx, out=y_out[:n_out])
+    
+    def _set_trace(self, line, buf: np.ndarray, idx_buf: np.ndarray, values: np.ndarray, width: float):
+        """Set line data, downsampling when there are more samples than pixels"""
+        n_out = int(width)
+        if len(values) > n_out >= 3:
+            line.set_data(*self.downsample_lttb(values, n_out, idx_buf, buf))
+            self._downsampled.add(line)
+        elif line in self._downsampled:
+            line.set_data(self._x, self._fill(buf, values))
+            self._downsampled.discard(line)
+        else:
+            # Only y changes; x stays the cached full-length axis
+            line.set_ydata(self._fill(buf, values))
+    
     def update_plots(self, data_manager: DataManager):
         """Update plots with new data"""
-        if not data_manager.angle_data:
+        if data_manager.version == self._last_version:
+            return
+        self._last_version = data_manager.version
+        
+        if not len(data_manager):
             return
         
-        x = np.arange(len(data_manager.angle_data))
+        commanded, feedback, error = data_manager.snapshot()
+        self._set_trace(self.line_cmd, self._y_cmd, self._i_cmd, commanded, self.ax1.bbox.width)
+        self._set_trace(self.line_fb, self._y_fb, self._i_fb, feedback, self.ax1.bbox.width)
+        self._set_trace(self.line_err, self._y_err, self._i_err, error, self.ax2.bbox.width)
+        
+        self._blit()
+    
+    def clear_plots(self):
+        """Clear all plot data"""
+        for line, buf in ((self.line_cmd, self._y_cmd), (self.line_fb, self._y_fb), (self.line_err, self._y_err)):
+            buf.fill(np.nan)
+            line.set_data(self._x, buf)
+        self._downsampled.clear()
+        
+        self._blit()
+
+class QtPlotManager:
+    """Manages pyqtgraph plots for the plot process (used when pyqtgraph is installed)"""
+    
+    def __init__(self, max_size: int = 1000):
+        import pyqtgraph as pg
+        
+        self.max_size = max_size
+        self._x = np.arange(max_size)
+        # DataManager version last drawn, to skip frames with no new samples
+        self._last_version = -1
+        
+        self.win = pg.GraphicsLayoutWidget(title="Servo Plots")
+        self.win.resize(800, 600)
         
-        # Update line data
-        self.line_cmd.set_data(x, data_manager.angle_data)
-        self.line_fb.set_data(x, data_manager.feedback_data)
-        self.line_err.set_data(x, data_manager.error_data)
+        # Top plot: Commanded vs Feedback
+        self.ax1 = self.win.addPlot(title="Commanded vs Feedback Angle")
+        self.ax1.setLabel('bottom', "Sample")
+        self.ax1.setLabel('left', "Angle (°)")
+        self.ax1.addLegend()
+        self.line_cmd = self.ax1.plot(pen='b', name='Commanded')
+        self.line_fb = self.ax1.plot(pen='r', name='Feedback')
         
-        # Auto-scale axes
-        self.ax1.relim()
-        self.ax1.autoscale_view()
-        self.ax2.relim()
-        self.ax2.autoscale_view()
+        # Bottom plot: Error
+        self.win.nextRow()
+        self.ax2 = self.win.addPlot(title="Error (Commanded - Feedback)")
+        self.ax2.setLabel('bottom', "Sample")
+        self.ax2.setLabel('left', "Error (°)")
+        self.ax2.addLegend()
+        self.line_err = self.ax2.plot(pen='r', name='Error')
+        
+        for ax, y_range in ((self.ax1, (0, 180)), (self.ax2, (-180, 180))):
+            ax.setXRange(0, max_size, padding=0)
+            ax.setYRange(*y_range, padding=0)
+            ax.showGrid(x=True, y=True, alpha=0.3)
+            # Let pyqtgraph reduce traces to the visible pixel width
+            ax.setDownsampling(auto=True, mode='peak')
+            ax.setClipToView(True)
+        
+        # Closing would end plotting for the rest of the session; minimize instead
+        self._closing = False
+        self.win.closeEvent = self._on_close
+        self.win.show()
+    
+    def _on_close(self, event):
+        """Minimize instead of closing the plot window, unless shutting down"""
+        if self._closing:
+            event.accept()
+            return
         
-        # Redraw canvas
-        self.canvas.draw_idle()
+        event.ignore()
+        self.win.showMinimized()
+    
+    def close(self):
+        """Close the plot window for good (Qt 6 quit() is vetoed by an ignored close)"""
+        self._closing = True
+        self.win.close()
+    
+    def update_plots(self, data_manager: DataManager):
+        """Update plots with new data"""
+        if data_manager.version == self._last_version:
+            return
+        self._last_version = data_manager.version
+        
+        if not len(data_manager):
+            return
+        
+        # snapshot() returns copies, safe for pyqtgraph to keep and repaint later
+        commanded, feedback, error = data_manager.snapshot()
+        x = self._x[:len(commanded)]
+        self.line_cmd.setData(x, commanded)
+        self.line_fb.setData(x, feedback)
+        self.line_err.setData(x, error)
     
     def clear_plots(self):
         """Clear all plot data"""
-        self.line_cmd.set_data([], [])
-        self.line_fb.set_data([], [])
-        self.line_err.set_data([], [])
+        for line in (self.line_cmd, self.line_fb, self.line_err):
+            line.setData([], [])
+
+def _drain_plot_queue(plot_queue, data_manager: DataManager, plot_manager) -> bool:
+    """Apply everything queued since the last frame so bursts coalesce; False on stop"""
+    while True:
+        try:
+            item = plot_queue.get_nowait()
+        except queue.Empty:
+            return True
         
-        self.ax1.relim()
-        self.ax1.autoscale_view()
-        self.ax2.relim()
-        self.ax2.autoscale_view()
+        if item == PLOT_STOP:
+            return False
+        elif item == PLOT_CLEAR:
+            data_manager.clear()
+            plot_manager.clear_plots()
+        else:
+            data_manager.add_data_point(*item)
+
+def plot_worker(plot_queue, config: ServoConfig):
+    """Plot process entry point: owns its own window, data buffers and plots
+    
+    Renders with pyqtgraph when it is installed, otherwise with matplotlib in a Tk window.
+    """
+    data_manager = DataManager(config.MAX_DATA_POINTS)
+    
+    try:
+        import pyqtgraph as pg
+    except ImportError:
+        pg = None
+    
+    if pg is not None:
+        app = pg.mkQApp("Servo Plots")
+        plot_manager = QtPlotManager(config.MAX_DATA_POINTS)
+        
+        def poll():
+            if _drain_plot_queue(plot_queue, data_manager, plot_manager):
+                plot_manager.update_plots(data_manager)
+            else:
+                plot_manager.close()
+                app.quit()
+        
+        timer = pg.QtCore.QTimer()
+        timer.timeout.connect(poll)
+        timer.start(config.PLOT_UPDATE_INTERVAL_MS)
+        pg.exec()
+        return
+    
+    root = tk.Tk()
+    root.title("Servo Plots")
+    # Closing would end plotting for the rest of the session; minimize instead
+    root.protocol("WM_DELETE_WINDOW", root.iconify)
+    plot_manager = PlotManager(root, config.MAX_DATA_POINTS)
+    
+    def poll():
+        if not _drain_plot_queue(plot_queue, data_manager, plot_manager):
+            root.destroy()
+            return
         
-        self.canvas.draw_idle()
+        plot_manager.update_plots(data_manager)
+        root.after(config.PLOT_UPDATE_INTERVAL_MS, poll)
+    
+    root.after(config.PLOT_UPDATE_INTERVAL_MS, poll)
+    root.mainloop()
 
 class ServoControlGUI:
     """Main GUI application class"""
@@ -225,7 +590,19 @@ class ServoControlGUI:
         # State variables
         self.is_running = False
         self.is_clockwise = True
+        # Servo angle = offset + sign * GUI angle (CW: 1, 0; CCW: -1, 180)
+        self._dir_sign, self._dir_off = 1, 0
         self.last_commanded_angle: Optional[float] = None
+        self._angle_after: Optional[str] = None
+        
+        # Recent (commanded, feedback) samples from the data collection thread;
+        # the display timer only formats the newest one
+        self._recent = deque(maxlen=32)
+        self._shown_sample: Optional[Tuple[float, float]] = None
+        
+        # Events from the data collection thread, applied on the Tk thread
+        self._ui_events = queue.SimpleQueue()
+        self._stop_event = threading.Event()
         
         # Setup GUI
         self._setup_gui()
@@ -239,16 +616,10 @@ class ServoControlGUI:
         self.root.title("Optimized Servo Motor Control")
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-        # Create main frames
-        plot_frame = ttk.Frame(self.root)
-        plot_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
+        # Create main frame (plots live in their own process window)
         control_frame = ttk.Frame(self.root)
         control_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        # Initialize plot manager
-        self.plot_manager = PlotManager(plot_frame)
-        
         # Setup controls
         self._setup_controls(control_frame)
         
@@ -312,6 +683,8 @@ class ServoControlGUI:
             'status': tk.StringVar(value="Stopped"),
             'connection': tk.StringVar(value="Connected" if self.serial_manager.is_connected else "Disconnected")
         }
+        # Last text written to each variable, so unchanged values skip the Tcl write
+        self._last_text = {key: var.get() for key, var in self.status_vars.items()}
         
         labels = [
             ("GUI Target:", 'gui_angle'),
@@ -367,11 +740,19 @@ class ServoControlGUI:
     
     def _get_actual_servo_angle(self) -> float:
         """Convert GUI angle to actual servo angle based on direction"""
-        gui_angle = self.angle_var.get()
-        return gui_angle if self.is_clockwise else 180 - gui_angle
+        return self._dir_off + self._dir_sign * self.angle_var.get()
     
     def _on_angle_change(self, value):
-        """Handle angle slider change"""
+        """Handle angle slider change, debounced so a drag is applied once"""
+        if self._angle_after is not None:
+            self.root.after_cancel(self._angle_after)
+        self._angle_after = self.root.after(
+            self.config.ANGLE_DEBOUNCE_MS, lambda v=value: self._apply_angle_change(v)
+        )
+    
+    def _apply_angle_change(self, value):
+        """Apply the last slider value of a debounce window"""
+        self._angle_after = None
         angle = int(float(value))
         self._update_displays()
         logger.info(f"Target set to: GUI={angle}°, Servo={self._get_actual_servo_angle()}°")
@@ -379,6 +760,7 @@ class ServoControlGUI:
     def _set_clockwise(self):
         """Set clockwise direction"""
         self.is_clockwise = True
+        self._dir_sign, self._dir_off = 1, 0
         self.cw_btn.configure(state='disabled')
         self.ccw_btn.configure(state='normal')
         self._update_displays()
@@ -387,6 +769,7 @@ class ServoControlGUI:
     def _set_counterclockwise(self):
         """Set counter-clockwise direction"""
         self.is_clockwise = False
+        self._dir_sign, self._dir_off = -1, 180
         self.ccw_btn.configure(state='disabled')
         self.cw_btn.configure(state='normal')
         self._update_displays()
@@ -434,11 +817,10 @@ class ServoControlGUI:
         """Reset the entire system (kept as internal method for potential future use)"""
         self.is_running = False
         self.angle_var.set(90)
-        self.is_clockwise = True
         
         # Clear data
         self.data_manager.clear()
-        self.plot_manager.clear_plots()
+        self._send_plot_control(PLOT_CLEAR)
         self._update_displays()
         
         # Reset GUI state
@@ -455,7 +837,7 @@ class ServoControlGUI:
     
     def _save_data(self):
         """Save data to CSV file"""
-        if not self.data_manager.angle_data:
+        if not len(self.data_manager):
             messagebox.showwarning("Save Error", "No data to save!")
             return
         
@@ -474,76 +856,139 @@ class ServoControlGUI:
         """Clear all collected data"""
         if messagebox.askyesno("Clear Data", "Are you sure you want to clear all data?"):
             self.data_manager.clear()
-            self.plot_manager.clear_plots()
+            self._send_plot_control(PLOT_CLEAR)
             self._update_displays()
             logger.info("Data cleared")
     
+    def _set_status(self, key: str, text: str):
+        """Set a status variable only if its text changed"""
+        if self._last_text[key] != text:
+            self.status_vars[key].set(text)
+            self._last_text[key] = text
+    
     def _update_displays(self):
         """Update all status displays"""
         gui_angle = self.angle_var.get()
         servo_angle = self._get_actual_servo_angle()
         
-        self.status_vars['gui_angle'].set(f"{gui_angle}°")
-        self.status_vars['servo_angle'].set(f"{servo_angle}°")
-        self.status_vars['direction'].set("Clockwise" if self.is_clockwise else "Counter-CW")
-        self.status_vars['status'].set("Running" if self.is_running else "Stopped")
-        self.status_vars['connection'].set("Connected" if self.serial_manager.is_connected else "Disconnected")
+        self._set_status('gui_angle', f"{gui_angle}°")
+        self._set_status('servo_angle', f"{servo_angle}°")
+        self._set_status('direction', "Clockwise" if self.is_clockwise else "Counter-CW")
+        self._set_status('status', "Running" if self.is_running else "Stopped")
+        self._set_status('connection', "Connected" if self.serial_manager.is_connected else "Disconnected")
         
         # Update statistics if data available
         stats = self.data_manager.get_statistics()
         if stats:
-            self.status_vars['avg_error'].set(f"{stats['avg_error']:.2f}°")
-            self.status_vars['max_error'].set(f"{stats['max_error']:.2f}°")
+            self._set_status('avg_error', f"{stats['avg_error']:.2f}°")
+            self._set_status('max_error', f"{stats['max_error']:.2f}°")
     
     def _start_threads(self):
         """Start background threads"""
+        # Plot process (rendering runs off the Tk main loop)
+        # Spawn on every platform: a forked child would inherit the Tk interpreter,
+        # X display connection and serial fd that already exist at this point
+        ctx = mp.get_context('spawn')
+        self.plot_queue = ctx.Queue(maxsize=self.config.MAX_DATA_POINTS)
+        self.plot_process = ctx.Process(
+            target=plot_worker, args=(self.plot_queue, self.config), daemon=True
+        )
+        self.plot_process.start()
+        
         # Data collection thread
         self.data_thread = threading.Thread(target=self._data_collection_loop, daemon=True)
         self.data_thread.start()
         
-        # Plot update timer
-        self.root.after(self.config.PLOT_UPDATE_INTERVAL_MS, self._update_plots_timer)
-        
         # Display update timer
         self.root.after(self.config.UPDATE_INTERVAL_MS, self._update_displays_timer)
     
     def _data_collection_loop(self):
         """Background thread for data collection"""
-        while True:
-            if self.serial_manager.is_connected:
-                line = self.serial_manager.readline()
-                
-                if line and line.startswith("Angle:") and self.last_commanded_angle is not None:
+        while not self._stop_event.is_set():
+            if not self.serial_manager.is_connected:
+                self._stop_event.wait(0.5)  # Nothing to read, avoid spinning
+                continue
+            
+            # read_lines blocks in the driver until data arrives (no polling)
+            for line in self.serial_manager.read_lines():
+                if line.startswith(ANGLE_PREFIX) and self.last_commanded_angle is not None:
                     try:
-                        feedback_angle = float(line.split(":")[1])
-                        self.data_manager.add_data_point(self.last_commanded_angle, feedback_angle)
-                        
-                        # Update current angle display (thread-safe)
-                        self.root.after_idle(lambda: self.status_vars['current_angle'].set(f"{feedback_angle}°"))
-                        self.root.after_idle(lambda: self.status_vars['error'].set(f"{self.last_commanded_angle - feedback_angle:.2f}°"))
+                        # float() parses ASCII bytes directly, no decode/split needed
+                        sample = (self.last_commanded_angle, float(line[len(ANGLE_PREFIX):]))
+                        self.data_manager.add_data_point(*sample)
+                        self._send_plot(sample)
+                        self._recent.append(sample)  # Picked up by the display timer
                         
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to parse angle data: {line} - {e}")
+                    except ValueError as e:
+                        logger.warning(f"Failed to parse angle data: {line.decode(errors='replace')} - {e}")
                 
-                elif line and line.startswith("TARGET_REACHED"):
-                    self.root.after_idle(self._auto_stop)
+                elif line.startswith(TARGET_REACHED_PREFIX):
+                    self._ui_events.put('target_reached')
+    
+    def _send_plot(self, sample: Tuple[float, float]):
+        """Queue a data point for the plot process"""
+        try:
+            self.plot_queue.put_nowait(sample)
+        except queue.Full:
+            pass  # Plot process is behind; drop samples rather than block the reader
+    
+    def _send_plot_control(self, message: str):
+        """Queue a control message for the plot process, waiting for room instead of dropping it"""
+        if not self.plot_process.is_alive():
+            return
+        
+        try:
+            self.plot_queue.put(message, timeout=1.0)
+        except queue.Full:
+            logger.warning(f"Plot process not responding, {message} message dropped")
+    
+    def _process_ui_events(self):
+        """Apply events queued by the data collection thread (runs on the Tk thread)"""
+        while True:
+            try:
+                event = self._ui_events.get_nowait()
+            except queue.Empty:
+                break
             
-            time.sleep(0.01)  # Small sleep to prevent excessive CPU usage
+            if event == 'target_reached':
+                self._auto_stop()
     
-    def _update_plots_timer(self):
-        """Timer callback for plot updates"""
-        self.plot_manager.update_plots(self.data_manager)
-        self.root.after(self.config.PLOT_UPDATE_INTERVAL_MS, self._update_plots_timer)
+    def _update_feedback_display(self):
+        """Show the most recent feedback sample, once per display tick"""
+        try:
+            sample = self._recent[-1]
+        except IndexError:
+            return
+        if sample is self._shown_sample:
+            return  # No new data since the last tick
+        
+        self._shown_sample = sample
+        commanded, feedback = sample
+        self._set_status('current_angle', f"{feedback}°")
+        self._set_status('error', f"{commanded - feedback:.2f}°")
     
     def _update_displays_timer(self):
         """Timer callback for display updates"""
+        self._process_ui_events()
+        self._update_feedback_display()
         self._update_displays()
         self.root.after(self.config.UPDATE_INTERVAL_MS, self._update_displays_timer)
     
     def _on_closing(self):
         """Handle application closing"""
         logger.info("Shutting down application...")
+        self._stop_event.set()
+        self.serial_manager.cancel_read()
+        self.data_thread.join(timeout=1.0)
         self.serial_manager.close()
+        
+        self._send_plot_control(PLOT_STOP)
+        self.plot_process.join(timeout=1.0)
+        if self.plot_process.is_alive():
+            self.plot_process.terminate()
+            # The queue's feeder thread may be blocked on a pipe nobody reads; don't join it at exit
+            self.plot_queue.cancel_join_thread()
+        
         self.root.destroy()
     
     def run(self):